@@ -4,46 +4,324 @@ Autonomous PCAM Programming Assistant - Test Client
 Demonstrates how to interact with the N8N workflow for autonomous programming tasks.
 """
 
+import concurrent.futures
+import copy
 import json
-import requests
+import os
+import queue
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# requests drags in urllib3, certifi, charset detection, idna - dozens of
+# modules the interactive CLI never needs if the user quits at the first
+# prompt. Import it lazily when the first client is constructed.
+requests = None
+HTTPAdapter = None
+Retry = None
+httpx = None
+
+
+def _ensure_requests() -> None:
+    """Bind the HTTP machinery to module globals on first use."""
+    global requests, HTTPAdapter, Retry, httpx
+    if requests is None:
+        import requests as _requests
+        from requests.adapters import HTTPAdapter as _HTTPAdapter
+        from urllib3.util.retry import Retry as _Retry
+        requests = _requests
+        HTTPAdapter = _HTTPAdapter
+        Retry = _Retry
+        try:
+            import httpx as _httpx
+            httpx = _httpx
+        except ImportError:
+            pass
 
 class PCamProgrammingClient:
     """Client for interacting with the Autonomous PCAM Programming N8N workflow."""
-    
-    def __init__(self, webhook_url: str, timeout: int = 300):
+
+    # Serializes result output so concurrent workers don't interleave lines.
+    _print_lock = threading.Lock()
+
+    # Retry policy shared by both transports: urllib3 Retry enforces it on
+    # the requests adapter, and the httpx path mirrors it in _post_raw /
+    # _post_detached so swapping transports never drops resilience.
+    _RETRY_TOTAL = 3
+    _RETRY_BACKOFF = 0.5
+    _RETRY_STATUSES = (429, 502, 503, 504)
+
+    # Decorative banners built once at class load instead of per result.
+    _BANNER = "=" * 60
+    _HEADER = f"\n{_BANNER}\n🤖 AUTONOMOUS PCAM PROGRAMMING RESULTS\n{_BANNER}\n"
+    _FOOTER = _BANNER + "\n\n"
+
+
+    def __init__(self, webhook_url: str, timeout: int = 300, rps: float = 2.0):
         """
         Initialize the PCAM client.
-        
+
         Args:
             webhook_url: The N8N webhook URL for the autonomous programming workflow
             timeout: Request timeout in seconds (default: 5 minutes)
+            rps: Sustained requests per second allowed by the rate limiter
         """
+        _ensure_requests()
+
         self.webhook_url = webhook_url
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.rps = rps
+        headers = {
             'Content-Type': 'application/json',
-            'User-Agent': 'PCamProgrammingClient/1.0'
-        })
+            'User-Agent': 'PCamProgrammingClient/1.0',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+
+        # Prefer HTTP/2 via httpx when installed: one TLS session multiplexes
+        # all concurrent requests as streams instead of one connection each.
+        # Fall back to the requests/urllib3 HTTP/1.1 stack otherwise.
+        self._transport = 'requests'
+        if httpx is not None:
+            try:
+                self.session = httpx.Client(
+                    timeout=timeout,
+                    # Connection-specific headers are forbidden on HTTP/2.
+                    headers={k: v for k, v in headers.items() if k != 'Connection'},
+                    # Connect-error retries; status retries happen in _post_raw.
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=self._RETRY_TOTAL,
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=32)
+                    )
+                )
+                self._transport = 'httpx'
+            except ImportError:
+                pass  # httpx installed without the h2 extra
+
+        if self._transport == 'requests':
+            self.session = requests.Session()
+            self.session.headers.update(headers)
+
+            # The default Session pool holds only 10 connections; under the
+            # concurrent test suite the extras get discarded and every overflow
+            # request pays a fresh TCP+TLS handshake. Size the pool for the
+            # parallelism we actually use so connections to the N8N host are
+            # kept alive and reused.
+            # Transient 429/5xx responses from the N8N instance self-heal with
+            # exponential backoff instead of aborting the whole test case. The
+            # webhook is idempotent for analysis prompts, so retrying POST is safe.
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['POST']),
+                respect_retry_after_header=True
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, pool_block=False,
+                                  max_retries=retry)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+        # Worker pool backing the async submission API below.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+        # LRU cache of successful responses keyed on (prompt, project_path).
+        # Re-running an identical prompt (common when retrying a test case)
+        # becomes a dict lookup instead of a full LLM round-trip.
+        self._cache: 'OrderedDict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._cache_ttl = 3600
+        self._cache_max_entries = 256
+        self._cache_lock = threading.Lock()
+
+        # Prompts longer than this are rejected client-side.
+        self._max_prompt_chars = 100_000
+
+        # Token bucket pacing outgoing requests: bursts up to rps tokens are
+        # allowed, then callers sleep just long enough for a token to refill.
+        self._bucket_tokens = rps
+        self._bucket_last = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+    def _acquire_token(self) -> None:
+        """Block until the token bucket permits another outgoing request."""
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._bucket_tokens = min(
+                    self.rps,
+                    self._bucket_tokens + (now - self._bucket_last) * self.rps
+                )
+                self._bucket_last = now
+                if self._bucket_tokens >= 1:
+                    self._bucket_tokens -= 1
+                    return
+                wait = (1 - self._bucket_tokens) / self.rps
+            time.sleep(wait)
+
+    def close(self) -> None:
+        """Release the underlying session and worker pool.
+
+        A single PCamProgrammingClient instance should be shared for the
+        lifetime of the process so TCP+TLS connections to the N8N host are
+        reused; call close() (or use the client as a context manager) when
+        the process is done with it.
+        """
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self) -> 'PCamProgrammingClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _retry_backoff(self, response, attempt: int) -> float:
+        """Seconds to sleep before retrying a 429/5xx response."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self._RETRY_BACKOFF * (2 ** attempt)
+
+    def _post_raw(self, payload: Dict[str, Any]) -> bytes:
+        """POST payload to the webhook and return the raw response bytes.
+
+        Whichever transport is active, failures surface as the requests
+        exception types the public methods document.
+        """
+        if self._transport == 'httpx':
+            try:
+                # Mirror the urllib3 Retry policy the requests adapter gets:
+                # back off and retry transient statuses, honoring Retry-After.
+                for attempt in range(self._RETRY_TOTAL + 1):
+                    response = self.session.post(
+                        self.webhook_url,
+                        content=_json_dumps(payload)
+                    )
+                    if (response.status_code in self._RETRY_STATUSES
+                            and attempt < self._RETRY_TOTAL):
+                        time.sleep(self._retry_backoff(response, attempt))
+                        continue
+                    break
+                response.raise_for_status()
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e))
+            except httpx.HTTPStatusError as e:
+                raise requests.exceptions.HTTPError(str(e))
+            except httpx.RequestError as e:
+                raise requests.exceptions.RequestException(str(e))
+            return response.content
+
+        # Stream the body in chunks rather than letting requests buffer
+        # it twice - N8N responses with a full project analysis can be large.
+        response = self.session.post(
+            self.webhook_url,
+            data=_json_dumps(payload),
+            timeout=self.timeout,
+            stream=True
+        )
+        response.raise_for_status()
+        return b"".join(response.iter_content(65536))
+
+    def _post_detached(self, payload: Dict[str, Any]) -> int:
+        """POST payload and return once response headers arrive.
+
+        The body is never read - the connection is closed as soon as the
+        status code is known, so the caller pays one round-trip instead of
+        waiting out the workflow.
+        """
+        if self._transport == 'httpx':
+            try:
+                for attempt in range(self._RETRY_TOTAL + 1):
+                    with self.session.stream(
+                        'POST',
+                        self.webhook_url,
+                        content=_json_dumps(payload)
+                    ) as response:
+                        if (response.status_code in self._RETRY_STATUSES
+                                and attempt < self._RETRY_TOTAL):
+                            wait = self._retry_backoff(response, attempt)
+                        else:
+                            response.raise_for_status()
+                            return response.status_code
+                    time.sleep(wait)
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e))
+            except httpx.HTTPStatusError as e:
+                raise requests.exceptions.HTTPError(str(e))
+            except httpx.RequestError as e:
+                raise requests.exceptions.RequestException(str(e))
+
+        response = self.session.post(
+            self.webhook_url,
+            data=_json_dumps(payload),
+            timeout=self.timeout,
+            stream=True
+        )
+        try:
+            response.raise_for_status()
+            return response.status_code
+        finally:
+            response.close()
     
-    def execute_programming_task(self, prompt: str, project_path: Optional[str] = None) -> Dict[str, Any]:
+    def execute_programming_task(self, prompt: str, project_path: Optional[str] = None,
+                                 force: bool = False, detach: bool = False) -> Dict[str, Any]:
         """
         Execute a programming task using PCAM decomposition.
-        
+
         Args:
             prompt: Natural language description of the programming task
             project_path: Optional path to the project directory
-            
+            force: Bypass the response cache and re-run the workflow
+            detach: Fire-and-forget - return once the webhook accepts the
+                request, without downloading or parsing the result body
+
         Returns:
-            Dict containing the execution results and analysis
-            
+            Dict containing the execution results and analysis, or
+            {"status": "submitted", "http_status": ...} when detach is set
+
         Raises:
             requests.RequestException: If the request fails
             ValueError: If the response is invalid
         """
-        
+
+        # Structurally invalid prompts are rejected locally: no point paying
+        # an N8N workflow cold-start for a request the server is guaranteed
+        # to refuse (blank Enter in the REPL, fuzz input, oversized paste).
+        stripped = prompt.strip() if prompt else ''
+        if len(stripped) < 5 or len(stripped) > self._max_prompt_chars:
+            result = {
+                'status': 'error',
+                'message': 'Prompt too short' if len(stripped) < 5 else 'Prompt too long',
+                'reason': 'validation',
+                'automation_confidence': 0.0
+            }
+            self._print_results(result)
+            return result
+
+        # Detached calls are fire-and-forget triggers: the caller wants the
+        # server-side side effect, so a cache hit must never swallow the post.
+        cache_key = (stripped, project_path)
+        if not force and not detach:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                print(f"♻️  Cached result for prompt: {prompt}")
+                self._print_results(cached)
+                return cached
+
         payload = {"prompt": prompt}
         if project_path:
             payload["projectPath"] = project_path
@@ -52,17 +330,20 @@ class PCamProgrammingClient:
         print(f"📝 Prompt: {prompt}")
         if project_path:
             print(f"📁 Project Path: {project_path}")
-        print(f"⏳ Waiting for autonomous execution...")
-        
+        if not detach:
+            print(f"⏳ Waiting for autonomous execution...")
+
+        self._acquire_token()
+
         try:
-            response = self.session.post(
-                self.webhook_url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            result = response.json()
+            if detach:
+                http_status = self._post_detached(payload)
+                print(f"📨 Submitted (HTTP {http_status}) - not waiting for results")
+                return {"status": "submitted", "http_status": http_status}
+
+            raw = self._post_raw(payload)
+            result = _json_loads(raw)
+            self._cache_put(cache_key, result)
             self._print_results(result)
             return result
             
@@ -71,76 +352,201 @@ class PCamProgrammingClient:
         except requests.exceptions.RequestException as e:
             raise requests.RequestException(f"Failed to execute programming task: {e}")
         except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
             raise ValueError("Invalid JSON response from N8N workflow")
     
+    def execute_programming_tasks(self, tasks: list) -> list:
+        """
+        Execute several programming tasks in a single webhook call.
+
+        The fixed per-call overhead (workflow cold-start, webhook auth, JSON
+        framing) is paid once for the whole batch instead of once per task.
+
+        Args:
+            tasks: List of dicts with a "prompt" key and optional "project_path"
+
+        Returns:
+            List of result dicts aligned to the input order
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is invalid
+        """
+
+        # Build each entry exactly like the single-task payload: projectPath
+        # is omitted when unset, not sent as null.
+        batch = []
+        for task in tasks:
+            entry = {"prompt": task["prompt"]}
+            if task.get("project_path"):
+                entry["projectPath"] = task["project_path"]
+            batch.append(entry)
+        payload = {"batch": batch}
+
+        print(f"🚀 Sending batch of {len(tasks)} autonomous programming requests...")
+        print(f"⏳ Waiting for autonomous execution...")
+
+        self._acquire_token()
+
+        try:
+            raw = self._post_raw(payload)
+            parsed = _json_loads(raw)
+            if not isinstance(parsed, dict):
+                raise ValueError("Invalid JSON response from N8N workflow")
+            results = parsed.get('results', [])
+            for result in results:
+                self._print_results(result)
+            return results
+
+        except requests.exceptions.Timeout:
+            raise requests.RequestException("Request timed out - autonomous execution may still be running")
+        except requests.exceptions.RequestException as e:
+            raise requests.RequestException(f"Failed to execute programming tasks: {e}")
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            raise ValueError("Invalid JSON response from N8N workflow")
+
+    def _cache_get(self, key: 'Tuple[str, Optional[str]]') -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for key, or None if absent/expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.time() - stored_at >= self._cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return copy.deepcopy(result)
+
+    def _cache_put(self, key: 'Tuple[str, Optional[str]]', result: Dict[str, Any]) -> None:
+        """Cache a successful result; errors and safety overrides are never cached."""
+        if result.get('status') != 'success':
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.time(), copy.deepcopy(result))
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def execute_programming_task_async(self, prompt: str, project_path: Optional[str] = None) -> 'concurrent.futures.Future':
+        """
+        Submit a programming task without blocking on the N8N workflow.
+
+        The request runs on a background worker, so callers can fire off
+        several tasks and overlap their own work with server-side execution.
+
+        Args:
+            prompt: Natural language description of the programming task
+            project_path: Optional path to the project directory
+
+        Returns:
+            Future resolving to the same dict execute_programming_task returns
+        """
+        return self._executor.submit(self.execute_programming_task, prompt, project_path)
+
+    def gather(self, futures) -> list:
+        """
+        Wait for async task futures and return their results as they complete.
+
+        Args:
+            futures: Iterable of futures from execute_programming_task_async
+
+        Returns:
+            List of result dicts, ordered by completion time
+        """
+        results = []
+        for future in concurrent.futures.as_completed(list(futures)):
+            results.append(future.result())
+        return results
+
     def _print_results(self, result: Dict[str, Any]) -> None:
-        """Print formatted results from the autonomous execution."""
-        
-        print("\n" + "="*60)
-        print("🤖 AUTONOMOUS PCAM PROGRAMMING RESULTS")
-        print("="*60)
-        
+        """Print formatted results from the autonomous execution.
+
+        The output is assembled into one string and written with a single
+        locked sys.stdout.write so results from concurrent workers never
+        interleave and the per-result print overhead stays at one syscall.
+        """
+
+        buf = []
+        append = buf.append
+
+        append(self._HEADER)
+
+        # Fetch each sub-dict once and bind its fields to locals - one dict
+        # probe per key instead of repeated .get chains on the hot path.
         status = result.get('status', 'unknown')
         if status == 'success':
-            print("✅ Status: SUCCESS")
-            
+            append("✅ Status: SUCCESS\n")
+
             # Execution Summary
-            summary = result.get('execution_summary', {})
-            print(f"🔧 Operations Count: {summary.get('operations_count', 0)}")
-            print(f"🛡️  Safety Checks: {'✅ PASSED' if summary.get('safety_checks_passed') else '❌ FAILED'}")
-            print(f"🤝 User Intervention: {'❗ REQUIRED' if summary.get('user_intervention_required') else '🤖 AUTONOMOUS'}")
-            
+            summary = result.get('execution_summary') or {}
+            operations_count = summary.get('operations_count', 0)
+            safety_passed = summary.get('safety_checks_passed')
+            intervention = summary.get('user_intervention_required')
+            append(f"🔧 Operations Count: {operations_count}\n")
+            append(f"🛡️  Safety Checks: {'✅ PASSED' if safety_passed else '❌ FAILED'}\n")
+            append(f"🤝 User Intervention: {'❗ REQUIRED' if intervention else '🤖 AUTONOMOUS'}\n")
+
             # Project Analysis
-            analysis = result.get('project_analysis', {})
+            analysis = result.get('project_analysis') or {}
             if analysis:
-                print(f"\n📊 PROJECT ANALYSIS:")
-                
-                deps = analysis.get('dependencies_found', [])
+                append(f"\n📊 PROJECT ANALYSIS:\n")
+
+                deps = analysis.get('dependencies_found')
+                missing = analysis.get('missing_files')
+                improvements = analysis.get('potential_improvements')
+
                 if deps:
-                    print(f"   📦 Dependencies: {', '.join(deps)}")
-                
-                missing = analysis.get('missing_files', [])
+                    append(f"   📦 Dependencies: {', '.join(deps)}\n")
+
                 if missing:
-                    print(f"   📄 Missing Files: {', '.join(missing)}")
-                
-                improvements = analysis.get('potential_improvements', [])
+                    append(f"   📄 Missing Files: {', '.join(missing)}\n")
+
                 if improvements:
-                    print(f"   🔧 Improvements: {len(improvements)} suggested")
+                    append(f"   🔧 Improvements: {len(improvements)} suggested\n")
                     for imp in improvements[:3]:  # Show first 3
-                        print(f"      • {imp}")
-            
+                        append(f"      • {imp}\n")
+
             # Next Steps
-            next_steps = result.get('next_steps', [])
+            next_steps = result.get('next_steps')
             if next_steps:
-                print(f"\n📋 NEXT STEPS:")
+                append(f"\n📋 NEXT STEPS:\n")
                 for step in next_steps[:5]:  # Show first 5
                     priority = step.get('priority', 'medium')
                     desc = step.get('description', 'No description')
                     automated = "🤖 AUTO" if step.get('automated') else "👤 MANUAL"
-                    print(f"   {automated} [{priority.upper()}] {desc}")
-                    
+                    append(f"   {automated} [{priority.upper()}] {desc}\n")
+
         else:
-            print("❌ Status: ERROR/SAFETY OVERRIDE")
-            print(f"💬 Message: {result.get('message', 'No message provided')}")
-            print(f"🔍 Reason: {result.get('reason', 'No reason provided')}")
-            
+            message = result.get('message', 'No message provided')
+            reason = result.get('reason', 'No reason provided')
             confidence = result.get('automation_confidence')
-            if confidence is not None:
-                print(f"🎯 Automation Confidence: {confidence:.1%}")
-                
             recommendation = result.get('recommended_action')
+
+            append("❌ Status: ERROR/SAFETY OVERRIDE\n")
+            append(f"💬 Message: {message}\n")
+            append(f"🔍 Reason: {reason}\n")
+
+            if confidence is not None:
+                append(f"🎯 Automation Confidence: {confidence:.1%}\n")
+
             if recommendation:
-                print(f"💡 Recommendation: {recommendation}")
-        
+                append(f"💡 Recommendation: {recommendation}\n")
+
         session_id = result.get('session_id')
         if session_id:
-            print(f"\n🆔 Session ID: {session_id}")
-            
+            append(f"\n🆔 Session ID: {session_id}\n")
+
         timestamp = result.get('timestamp')
         if timestamp:
-            print(f"⏰ Completed: {timestamp}")
-            
-        print("="*60 + "\n")
+            append(f"⏰ Completed: {timestamp}\n")
+
+        append(self._FOOTER)
+
+        with PCamProgrammingClient._print_lock:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
 
 # Example usage and test cases
 def main():
@@ -178,58 +584,90 @@ def main():
     print("🧪 AUTONOMOUS PCAM PROGRAMMING - TEST SUITE")
     print("="*50)
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n🔬 Test Case {i}/{len(test_cases)}")
-        print("-" * 30)
-        
-        try:
-            result = client.execute_programming_task(
-                prompt=test_case["prompt"],
-                project_path=test_case.get("project_path")
-            )
-            
-            # Brief pause between requests
-            time.sleep(2)
-            
-        except Exception as e:
-            print(f"❌ Test case failed: {e}")
-            continue
-    
+    # One webhook call carries the whole suite: the batch endpoint amortizes
+    # workflow cold-start and request framing across all cases at once.
+    try:
+        results = client.execute_programming_tasks(test_cases)
+        print(f"\n🔬 {len(results)}/{len(test_cases)} test cases returned")
+    except Exception as e:
+        print(f"❌ Test suite failed: {e}")
+
     print("\n🏁 Test suite completed!")
 
+def _stdin_reader(lines: 'queue.Queue') -> None:
+    """Read stdin lines on a background thread and queue them for dispatch."""
+    while True:
+        try:
+            lines.put(input())
+        except EOFError:
+            lines.put(None)
+            return
+
+
 if __name__ == "__main__":
     # Interactive mode for custom prompts
     WEBHOOK_URL = input("Enter your N8N webhook URL: ").strip()
-    
+
     if not WEBHOOK_URL:
         print("❌ No webhook URL provided. Exiting.")
         exit(1)
-    
-    client = PCamProgrammingClient(WEBHOOK_URL)
-    
-    print("\n🤖 Autonomous PCAM Programming Assistant")
-    print("Type your programming requests below (or 'quit' to exit):\n")
-    
-    while True:
+
+    # One client - and therefore one Session - for the whole REPL, so every
+    # request after the first reuses the TCP+TLS connection to the N8N host.
+    with PCamProgrammingClient(WEBHOOK_URL) as client:
+        print("\n🤖 Autonomous PCAM Programming Assistant")
+        print("Type a programming task per line (optionally 'task :: project path').")
+        print("Tasks run in the background - keep typing while earlier ones execute.")
+        print("Type 'quit' to exit.\n")
+
+        # Stdin is read on a daemon thread so the main loop can dispatch
+        # queued tasks and reap finished ones while the user is still typing.
+        lines: 'queue.Queue' = queue.Queue()
+        threading.Thread(target=_stdin_reader, args=(lines,), daemon=True).start()
+
+        pending = []
+        running = True
         try:
-            prompt = input("💬 Programming Task: ").strip()
-            
-            if prompt.lower() in ['quit', 'exit', 'q']:
-                break
-                
-            if not prompt:
-                continue
-                
-            project_path = input("📁 Project Path (optional): ").strip()
-            project_path = project_path if project_path else None
-            
-            result = client.execute_programming_task(prompt, project_path)
-            
-            print("\nPress Enter to continue or 'quit' to exit...")
-            
+            while running or pending:
+                try:
+                    line = lines.get(timeout=0.2)
+                except queue.Empty:
+                    line = ''
+                else:
+                    if line is None or line.strip().lower() in ['quit', 'exit', 'q']:
+                        running = False
+                        if pending:
+                            print(f"⏳ Waiting for {len(pending)} running task(s)...")
+                    elif running and line.strip():
+                        prompt, _, project_path = line.partition('::')
+                        prompt = prompt.strip()
+                        project_path = project_path.strip() or None
+                        pending.append(
+                            client.execute_programming_task_async(prompt, project_path)
+                        )
+
+                still_pending = []
+                for future in pending:
+                    if not future.done():
+                        still_pending.append(future)
+                        continue
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"❌ Error: {e}")
+                pending = still_pending
+
         except KeyboardInterrupt:
-            print("\n👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            continue
\ No newline at end of file
+            # Non-daemon pool workers are joined at interpreter exit, so
+            # in-flight requests would otherwise stall shutdown silently.
+            # The tasks run server-side regardless, so a second Ctrl+C may
+            # safely drop the process on the floor.
+            if pending:
+                print(f"\n⏳ Waiting for {len(pending)} running task(s)... "
+                      "(Ctrl+C again to force quit)")
+                try:
+                    concurrent.futures.wait(pending)
+                except KeyboardInterrupt:
+                    print("\n👋 Goodbye!")
+                    os._exit(0)
+            print("\n👋 Goodbye!")
\ No newline at end of file